@@ -0,0 +1,61 @@
+"""Combine the individual PACL model JSON files into the single bundle
+consumed by get_models.py, with each model embedded as an escaped JSON
+string under its file stem.
+"""
+
+import os
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+import orjson
+
+MODEL_DIR = Path("models")
+OUTPUT_FILE = Path("combined_models.json")
+
+
+def load_model_file(json_file):
+    """Read and validate one model file; returns ``(stem, text | None)``."""
+    raw = json_file.read_bytes()
+    try:
+        # Validate on the raw bytes — orjson takes them natively — and
+        # embed the original text as-is, skipping a re-serialization.
+        orjson.loads(raw)
+    except orjson.JSONDecodeError as error:
+        print(f"Skipping invalid model {json_file.name}: {error}")
+        return json_file.stem, None
+    return json_file.stem, raw.decode("utf-8")
+
+
+def read_model_files(directory=MODEL_DIR):
+    """Read every model JSON in ``directory`` into the combined structure."""
+    # scandir DirEntry objects carry the file type from readdir, so this
+    # avoids a stat per entry compared to Path.glob on large model dirs.
+    files = []
+    with os.scandir(directory) as entries:
+        for entry in entries:
+            if (
+                entry.is_file(follow_symlinks=False)
+                and entry.name.endswith(".json")
+                and entry.name != "_pretty_models.json"
+            ):
+                files.append(Path(entry.path))
+
+    combined_models = {"models": {}}
+    with ProcessPoolExecutor() as executor:
+        for stem, raw_text in executor.map(load_model_file, files, chunksize=32):
+            if raw_text is not None:
+                combined_models["models"][stem] = {"model": raw_text}
+
+    return combined_models
+
+
+def main():
+    combined_models = read_model_files()
+    OUTPUT_FILE.write_bytes(
+        orjson.dumps(combined_models, option=orjson.OPT_INDENT_2 | orjson.OPT_SORT_KEYS)
+    )
+    print(f"Wrote {len(combined_models['models'])} models to {OUTPUT_FILE}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,293 @@
+"""Fetch the PACL entity source data and textures used to build Cubane's
+entity assets.
+
+Produces ``minecraft_entities.json``: the entity list, the parsed entity
+models, and every referenced texture as base64 PNG data. Textures are
+fetched concurrently on one event loop over a bounded pool of kept-alive
+HTTPS connections and cached on disk so re-runs only hit the network for
+new entries.
+"""
+
+import asyncio
+import hashlib
+import mmap
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+import aiohttp
+import orjson
+import pybase64
+
+BASE_URL = "https://assets.pickaxis.net/pacl"
+SOURCE_URL = f"{BASE_URL}/entities.json"
+TEXTURE_URL = BASE_URL + "/textures/{name}.png"
+
+HEADERS = {
+    "User-Agent": "cubane-asset-pipeline/1.0 (+https://github.com/Nano112/cubane)",
+}
+
+CACHE_DIR = Path("cache")
+FINGERPRINT_FILE = CACHE_DIR / "output.fingerprint"
+OUTPUT_FILE = Path("minecraft_entities.json")
+
+MAX_CONCURRENT_FETCHES = 32
+REQUEST_TIMEOUT = 30
+
+
+async def download_source_data(session):
+    """Fetch the entity source JSON, using the on-disk cache when present."""
+    CACHE_DIR.mkdir(parents=True, exist_ok=True)
+    cache_file = CACHE_DIR / "entities_source.json"
+    if cache_file.exists():
+        return orjson.loads(cache_file.read_bytes())
+
+    async with session.get(SOURCE_URL) as response:
+        response.raise_for_status()
+        raw = await response.read()
+    cache_file.write_bytes(raw)
+    return orjson.loads(raw)
+
+
+_SAFE_NAME_TABLE = str.maketrans({"/": "_", "\\": "_"})
+
+
+def safe_texture_name(entity_name):
+    return entity_name.translate(_SAFE_NAME_TABLE)
+
+
+class TextureCache:
+    """Packed on-disk texture cache: one append-only blob plus a JSON
+    manifest of ``name -> (offset, length)``.
+
+    A warm run maps the blob once instead of opening one file per
+    texture; misses append to the blob and the manifest is flushed on
+    close.
+    """
+
+    def __init__(self, directory=CACHE_DIR):
+        self.blob_path = directory / "textures.bin"
+        self.index_path = directory / "textures_idx.json"
+        self.index = {}
+        self._blob = None
+        self._mapped = None
+        self._dirty = False
+        self._write_lock = threading.Lock()
+
+    def open(self):
+        if self.index_path.exists():
+            self.index = orjson.loads(self.index_path.read_bytes())
+        if self.blob_path.exists() and self.blob_path.stat().st_size:
+            self._blob = open(self.blob_path, "rb")
+            self._mapped = mmap.mmap(self._blob.fileno(), 0, access=mmap.ACCESS_READ)
+
+    def get(self, name):
+        """Return a zero-copy view into the mapped blob, or ``None``."""
+        entry = self.index.get(name)
+        if entry is None or self._mapped is None:
+            return None
+        offset, length = entry
+        if not length:
+            return None
+        return memoryview(self._mapped)[offset : offset + length]
+
+    def put(self, name, data):
+        # Serialised: puts may run concurrently via asyncio.to_thread and
+        # the recorded offset must match where the append landed.
+        with self._write_lock:
+            with open(self.blob_path, "ab") as blob:
+                offset = blob.tell()
+                blob.write(data)
+            self.index[name] = [offset, len(data)]
+            self._dirty = True
+
+    def close(self):
+        if self._mapped is not None:
+            try:
+                self._mapped.close()
+            except BufferError:
+                # An error escaping the encode stage can keep views into
+                # the map alive via the traceback; leave the map for GC
+                # rather than mask the original exception.
+                pass
+            self._blob.close()
+        if self._dirty:
+            self.index_path.write_bytes(orjson.dumps(self.index))
+
+
+async def download_texture(session, semaphore, cache, entity_name):
+    """Fetch one texture as raw PNG bytes, going through the packed cache.
+
+    Returns ``(entity_name, data)``; ``data`` is ``None`` when the
+    texture is unavailable.
+    """
+    cached = cache.get(safe_texture_name(entity_name))
+    if cached is not None:
+        return entity_name, cached
+
+    url = TEXTURE_URL.format(name=entity_name)
+    try:
+        async with semaphore, session.get(url) as response:
+            response.raise_for_status()
+            data = await response.read()
+    except (aiohttp.ClientError, asyncio.TimeoutError) as error:
+        print(f"Failed to download texture {entity_name}: {error}")
+        return entity_name, None
+
+    await asyncio.to_thread(cache.put, safe_texture_name(entity_name), data)
+    return entity_name, data
+
+
+def process_entity(raw_entity):
+    """Normalise one source entity record into the output shape."""
+    return {
+        "name": raw_entity["name"],
+        "model": raw_entity.get("model"),
+        "variants": [
+            {"name": variant["name"], "model": variant.get("model")}
+            for variant in raw_entity.get("variants", [])
+        ],
+    }
+
+
+def compute_fingerprint(cache):
+    """SHA-256 over the cached source JSON and the texture cache state."""
+    digest = hashlib.sha256()
+    source_cache = CACHE_DIR / "entities_source.json"
+    if source_cache.exists():
+        digest.update(source_cache.read_bytes())
+    for path in (cache.blob_path, cache.index_path):
+        if path.exists():
+            stat = path.stat()
+            digest.update(path.name.encode())
+            digest.update(str(stat.st_size).encode())
+            digest.update(str(stat.st_mtime_ns).encode())
+    return digest.hexdigest()
+
+
+async def main():
+    cache = TextureCache()
+    cache.open()
+    try:
+        rebuilt, complete = await build_output(cache)
+    finally:
+        cache.close()
+    if rebuilt and complete:
+        FINGERPRINT_FILE.write_text(compute_fingerprint(cache))
+    elif rebuilt:
+        # Failed downloads leave no trace in the blob or manifest, so a
+        # fingerprint written now would make every later run serve the
+        # incomplete output. Skip it so the next run retries.
+        print("Some textures failed; fingerprint not written")
+
+
+async def build_output(cache):
+    connector = aiohttp.TCPConnector(limit=MAX_CONCURRENT_FETCHES, ttl_dns_cache=300)
+    timeout = aiohttp.ClientTimeout(total=REQUEST_TIMEOUT)
+    async with aiohttp.ClientSession(
+        headers=HEADERS, connector=connector, timeout=timeout
+    ) as session:
+        source_data = await download_source_data(session)
+
+        # Neither the source JSON nor the texture cache changed: the
+        # previous output is still valid, skip the whole rebuild.
+        if (
+            OUTPUT_FILE.exists()
+            and FINGERPRINT_FILE.exists()
+            and FINGERPRINT_FILE.read_text() == compute_fingerprint(cache)
+        ):
+            print(f"Inputs unchanged; keeping existing {OUTPUT_FILE}")
+            return False, True
+
+        # First pass: normalise every entity and work out the unique set
+        # of texture names, so the network stage fetches each exactly
+        # once and does no other work.
+        entities = [
+            process_entity(raw_entity)
+            for category in source_data["categories"]
+            for raw_entity in category["entities"]
+        ]
+        needed_textures = {entity["name"] for entity in entities} | {
+            variant["name"] for entity in entities for variant in entity["variants"]
+        }
+
+        output = {
+            "entities": entities,
+            "entity_models": {},
+            "entity_textures": {},
+        }
+
+        for entity in entities:
+            model_name = entity["model"]
+            if model_name and model_name not in output["entity_models"]:
+                try:
+                    output["entity_models"][model_name] = orjson.loads(
+                        source_data["models"][model_name]["model"]
+                    )
+                except (KeyError, orjson.JSONDecodeError) as error:
+                    print(f"Bad model {model_name}: {error}")
+
+            for variant in entity["variants"]:
+                variant_model = variant["model"]
+                if variant_model and variant_model not in output["entity_models"]:
+                    try:
+                        output["entity_models"][variant_model] = orjson.loads(
+                            source_data["models"][variant_model]["model"]
+                        )
+                    except (KeyError, orjson.JSONDecodeError) as error:
+                        print(f"Bad model {variant_model}: {error}")
+
+        semaphore = asyncio.Semaphore(MAX_CONCURRENT_FETCHES)
+        results = await asyncio.gather(
+            *(
+                download_texture(session, semaphore, cache, name)
+                for name in sorted(needed_textures)
+            )
+        )
+
+    # Stage 2: cache hits are memoryviews into the mapped blob and
+    # encode in-process straight from that buffer — shipping them to a
+    # worker would copy each PNG twice through pickle. Fresh downloads
+    # are plain bytes and still batch across cores.
+    # The full key set is known up front; fromkeys over the set itself
+    # pre-sizes the hash table (CPython only does this for dict/set
+    # arguments). Key order is irrelevant — the final dump sorts keys.
+    encoded = dict.fromkeys(needed_textures)
+    fresh = {}
+    for name, data in results:
+        if data is None:
+            continue
+        if isinstance(data, memoryview):
+            encoded[name] = pybase64.b64encode_as_string(data)
+        else:
+            fresh[name] = data
+    results = None  # release the cache buffer views
+
+    if fresh:
+        with ProcessPoolExecutor() as executor:
+            encoded.update(
+                zip(
+                    fresh,
+                    executor.map(
+                        pybase64.b64encode_as_string, fresh.values(), chunksize=16
+                    ),
+                )
+            )
+    missing = [name for name, value in encoded.items() if value is None]
+    for name in missing:
+        del encoded[name]
+    output["entity_textures"] = encoded
+
+    OUTPUT_FILE.write_bytes(
+        orjson.dumps(output, option=orjson.OPT_INDENT_2 | orjson.OPT_SORT_KEYS)
+    )
+    print(
+        f"Wrote {len(output['entities'])} entities, "
+        f"{len(output['entity_models'])} models, "
+        f"{len(output['entity_textures'])} textures to {OUTPUT_FILE}"
+    )
+    return True, not missing
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
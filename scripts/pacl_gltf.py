@@ -0,0 +1,47 @@
+"""Convert the PACL glTF entity models into the base64 GLB mapping that
+ships as ``src/models.json`` and is decoded at runtime by EntityRenderer.
+"""
+
+import json
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+import pybase64
+from pygltflib import GLTF2
+
+GLTF_DIR = Path("gltf")
+OUTPUT_JSON = Path(__file__).resolve().parent.parent / "src" / "models.json"
+
+
+def pack_gltf(gltf_file):
+    """Load one glTF and return ``(name, base64 GLB)`` without touching disk."""
+    gltf = GLTF2().load(str(gltf_file))
+    glb_data = b"".join(gltf.save_to_bytes())
+    # Standard alphabet on purpose: EntityRenderer decodes these entries
+    # with atob(), which rejects the url-safe -_ variant.
+    return gltf_file.stem, pybase64.b64encode_as_string(glb_data)
+
+
+def create_base64_model_mapping(gltf_dir=GLTF_DIR, output_json=OUTPUT_JSON):
+    """Pack every glTF in ``gltf_dir`` into a ``{name: base64 GLB}`` JSON."""
+    gltf_files = sorted(gltf_dir.glob("*.gltf"))
+
+    # Stream each entry straight to disk so peak memory is one model's
+    # base64 string rather than the whole mapping.
+    count = 0
+    with open(output_json, "w") as out, ProcessPoolExecutor() as executor:
+        out.write("{")
+        for name, base64_data in executor.map(pack_gltf, gltf_files, chunksize=8):
+            if count:
+                out.write(",")
+            out.write(json.dumps(name))
+            out.write(":")
+            out.write(json.dumps(base64_data))
+            count += 1
+            print(f"Packed {name}")
+        out.write("}")
+    print(f"Wrote {count} models to {output_json}")
+
+
+if __name__ == "__main__":
+    create_base64_model_mapping()
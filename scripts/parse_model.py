@@ -0,0 +1,65 @@
+"""Split the combined models bundle back into individual model files,
+one pretty-printed JSON per model, plus a pretty copy of the whole
+bundle for reference.
+"""
+
+import argparse
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+import orjson
+
+SOURCE_FILE = Path("combined_models.json")
+DEST = Path("models")
+
+
+def dump_model(name, raw):
+    """Write one embedded model string out as a pretty-printed file."""
+    try:
+        model = orjson.loads(raw)
+    except orjson.JSONDecodeError as error:
+        print(f"Skipping invalid model {name}: {error}")
+        return
+    (DEST / f"{name}.json").write_bytes(
+        orjson.dumps(model, option=orjson.OPT_INDENT_2)
+    )
+
+
+def _dump_one(item):
+    dump_model(*item)
+
+
+def write_pretty_copy(root):
+    """Dump the whole bundle pretty-printed for human reference."""
+    (DEST / "_pretty_models.json").write_bytes(
+        orjson.dumps(root, option=orjson.OPT_INDENT_2 | orjson.OPT_SORT_KEYS)
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument(
+        "--pretty",
+        action="store_true",
+        help="also write the _pretty_models.json reference copy",
+    )
+    args = parser.parse_args()
+
+    root = orjson.loads(SOURCE_FILE.read_bytes())
+    DEST.mkdir(parents=True, exist_ok=True)
+
+    items = [
+        (name, entry["model"])
+        for name, entry in root["models"].items()
+        if "model" in entry
+    ]
+    with ProcessPoolExecutor() as executor:
+        list(executor.map(_dump_one, items, chunksize=64))
+
+    if args.pretty:
+        write_pretty_copy(root)
+    print(f"Wrote {len(root['models'])} models to {DEST}")
+
+
+if __name__ == "__main__":
+    main()